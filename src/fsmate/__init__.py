@@ -1,3 +1,3 @@
-from ._state import ImpossibleTransitionError, StateDescriptor
+from ._state import AttributeStateStorage, ImpossibleTransitionError, StateDescriptor
 
-__all__ = ['StateDescriptor', 'ImpossibleTransitionError']
+__all__ = ['StateDescriptor', 'ImpossibleTransitionError', 'AttributeStateStorage']
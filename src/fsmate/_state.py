@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from collections import defaultdict
+import sys
 from collections.abc import Collection
 from enum import Enum
+from functools import lru_cache
+from types import FunctionType, MethodType
 from typing import Any, Callable, Generic, NoReturn, Optional, Protocol, TypeVar, Union
 from typing_extensions import ParamSpec
+from weakref import WeakKeyDictionary
 
 
 class ImpossibleTransitionError(Exception):
@@ -30,6 +33,23 @@ class AttributeStateStorage:
         return setattr(instance, self._attr_name, state)
 
 
+class InstanceDictStateStorage:
+    """
+    Reads and writes state directly in the instance __dict__.
+    Used by transitions and dispatched methods of descriptors without custom storage
+    """
+
+    def __init__(self, key: str, default: Optional[Enum]) -> None:
+        self._key = key
+        self._default = default
+
+    def get_state(self, instance: object) -> Enum:
+        return instance.__dict__.get(self._key, self._default)  # type: ignore[return-value]
+
+    def set_state(self, instance: object, state: Enum) -> None:
+        instance.__dict__[self._key] = state
+
+
 class ProxyStateStorage:
     def __init__(
         self, getter: Callable[[object], Enum], setter: Callable[[object, Enum], None]
@@ -45,12 +65,29 @@ class StateTransition:
     Raises ImpossibleTransitionError otherwise
     """
 
-    def __init__(self, source: Collection[Enum], dest: Enum, state_storage: StateStorage) -> None:
+    __slots__ = (
+        '_source',
+        '_source_is_single',
+        '_source_single',
+        '_dest',
+        '_storage',
+        '_compiled',
+        '_callbacks',
+        '_has_callbacks',
+    )
+
+    def __init__(self, source: frozenset[Enum], dest: Enum, state_storage: StateStorage) -> None:
         self._source = source
+        # most transitions have exactly one source, which is checked without a set lookup
+        self._source_is_single = len(source) == 1
+        self._source_single: Optional[Enum] = next(iter(source)) if self._source_is_single else None
         self._dest = dest
         self._storage = state_storage
+        # generated function doing the whole transition, see StateDescriptor._compile_transition
+        self._compiled: Optional[Callable[[object], None]] = None
 
-        self._callbacks: list[Callable] = []
+        self._callbacks: tuple[Callable, ...] = ()
+        self._has_callbacks = False
 
     def __get__(
         self, instance: object, objtype: type
@@ -58,16 +95,10 @@ class StateTransition:
         if instance is None:
             return self
 
-        def _transition() -> None:
-            state = self._storage.get_state(instance)
-            if state not in self._source:
-                raise ImpossibleTransitionError()
-
-            self._storage.set_state(instance, self._dest)
-            for callback in self._callbacks:
-                callback(instance, state, self._dest)
+        if self._compiled is not None:
+            return MethodType(self._compiled, instance)
 
-        return _transition
+        return _BoundTransition(self, instance)
 
     def __call__(self) -> None:
         pass
@@ -76,7 +107,91 @@ class StateTransition:
         return f'{self.__class__.__name__}(source={self._source!r}, dest={self._dest!r}, state_storage={self._storage!r})'
 
     def _register_callback(self, func: Callable) -> None:
-        self._callbacks.append(func)
+        self._callbacks = (*self._callbacks, func)
+        self._has_callbacks = True
+
+
+class _BoundTransition:
+    __slots__ = ('_transition', '_instance')
+
+    def __init__(self, transition: StateTransition, instance: object) -> None:
+        self._transition = transition
+        self._instance = instance
+
+    def __call__(self) -> None:
+        transition = self._transition
+        instance = self._instance
+        storage = transition._storage
+
+        state = storage.get_state(instance)
+        # state may come from custom storage, so compare by value rather than identity
+        if transition._source_is_single:
+            if state != transition._source_single:
+                raise ImpossibleTransitionError()
+        elif state not in transition._source:
+            raise ImpossibleTransitionError()
+
+        dest = transition._dest
+        storage.set_state(instance, dest)
+        if transition._has_callbacks:
+            for callback in transition._callbacks:
+                callback(instance, state, dest)
+
+
+def _has_dense_int_values(states: type[Enum]) -> bool:
+    """
+    Check if state values are small non-negative ints usable as list indexes or bit positions
+    """
+    values = [state._value_ for state in states]
+    return (
+        bool(values)
+        and all(type(value) is int and value >= 0 for value in values)
+        and max(values) <= 2 * len(values)
+    )
+
+
+_TRANSITION_TEMPLATE = """
+def _make(source, dest, initial_state, callbacks, ImpossibleTransitionError):
+    def transition(self):
+        instance_dict = self.__dict__
+        state = instance_dict.get({key!r}, initial_state)
+        if state is not source:
+            raise ImpossibleTransitionError()
+        instance_dict[{key!r}] = dest
+{run_callbacks}
+    return transition
+"""
+
+_RUN_CALLBACKS = """
+        for callback in callbacks:
+            callback(self, state, dest)
+"""
+
+
+@lru_cache(maxsize=None)
+def _transition_factory(key: str, run_callbacks: bool) -> Callable[..., Callable[[object], None]]:
+    """
+    Compile transition template once per state key and presence of callbacks
+    """
+    source = _TRANSITION_TEMPLATE.format(
+        key=key, run_callbacks=_RUN_CALLBACKS if run_callbacks else ''
+    )
+    namespace: dict[str, Any] = {'__name__': __name__}
+    exec(compile(source, f'<fsmate transition {key}>', 'exec'), namespace)
+    return namespace['_make']  # type: ignore[no-any-return]
+
+
+# generated functions installed on owner classes in place of transitions, from any machine
+_INSTALLED_TRANSITIONS: WeakKeyDictionary[FunctionType, StateTransition] = WeakKeyDictionary()
+
+
+def _installed_transition(value: object) -> object:
+    """
+    Map function installed on the owner class back to its transition
+    """
+    if isinstance(value, FunctionType):
+        return _INSTALLED_TRANSITIONS.get(value, value)
+    return value
 
 
 T = TypeVar('T')
@@ -84,6 +199,8 @@ P = ParamSpec('P')
 
 
 class StateDispatcher(Generic[P, T]):
+    __slots__ = ('_all_states', '_fallback', '_state_storage', '_dispatch_table', '_table')
+
     def __init__(
         self, state_storage: StateStorage, all_states: type[Enum], fallback: Callable[P, T]
     ) -> None:
@@ -91,6 +208,8 @@ class StateDispatcher(Generic[P, T]):
         self._fallback = fallback
         self._state_storage = state_storage
         self._dispatch_table: dict[Enum, Callable[P, T]] = {}
+        self._table: Optional[list[Callable[P, T]]] = None
+        self._build_table()
 
     def register(self, func: Callable[P, T], *states: Enum) -> None:
         for state in states:
@@ -102,17 +221,37 @@ class StateDispatcher(Generic[P, T]):
 
             self._dispatch_table[state] = func
 
-    def _dispatch(self, state: Enum) -> Callable[P, T]:
-        return self._dispatch_table.get(state, self._fallback)
+        self._build_table()
+
+    def _build_table(self) -> None:
+        """
+        Materialize dispatch table as a list indexed by state value.
+        Only possible when states have small non-negative int values
+        """
+        if not _has_dense_int_values(self._all_states):
+            self._table = None
+            return
+
+        table = [self._fallback] * (max(state._value_ for state in self._all_states) + 1)
+        for state, func in self._dispatch_table.items():
+            table[state._value_] = func
+        self._table = table
 
     def dispatch(self, instance: object, *args: P.args, **kwargs: P.kwargs) -> T:
         current_state = self._state_storage.get_state(instance)
-        func = self._dispatch(current_state)
+        table = self._table
+        # states not belonging to the machine (e.g. from custom storage) go to the fallback
+        if table is not None and type(current_state) is self._all_states:
+            func = table[current_state._value_]
+        else:
+            func = self._dispatch_table.get(current_state, self._fallback)
 
         return func(*args, **kwargs)
 
 
 class StateDispatchedMethod(Generic[P, T]):
+    __slots__ = ('_dispatcher',)
+
     def __init__(self, dispatcher: StateDispatcher[P, T]) -> None:
         self._dispatcher = dispatcher
 
@@ -120,10 +259,7 @@ class StateDispatchedMethod(Generic[P, T]):
         if instance is None:
             return self  # type: ignore[return-value]
 
-        def dispatched_method(*args: P.args, **kwargs: P.kwargs) -> T:
-            return self._dispatcher.dispatch(instance, instance, *args, **kwargs)  # type: ignore[arg-type]
-
-        return dispatched_method
+        return _BoundDispatch(self._dispatcher, instance)
 
     def overload(self, *states: Enum) -> Callable[[Callable[P, T]], 'StateDispatchedMethod[P, T]']:
         def deco(meth: Callable[P, T]) -> 'StateDispatchedMethod[P, T]':
@@ -133,6 +269,28 @@ class StateDispatchedMethod(Generic[P, T]):
         return deco
 
 
+class _BoundDispatch(Generic[P, T]):
+    __slots__ = ('_dispatcher', '_instance')
+
+    def __init__(self, dispatcher: StateDispatcher[P, T], instance: object) -> None:
+        self._dispatcher = dispatcher
+        self._instance = instance
+
+    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> T:
+        dispatcher = self._dispatcher
+        instance = self._instance
+
+        # same lookup as StateDispatcher.dispatch, inlined to save a call
+        state = dispatcher._state_storage.get_state(instance)
+        table = dispatcher._table
+        if table is not None and type(state) is dispatcher._all_states:
+            func = table[state._value_]
+        else:
+            func = dispatcher._dispatch_table.get(state, dispatcher._fallback)
+
+        return func(instance, *args, **kwargs)  # type: ignore[arg-type]
+
+
 class StateDescriptor:
     def __init__(
         self,
@@ -147,19 +305,114 @@ class StateDescriptor:
         self._initial_state = initial_state
         self._state_storage = state_storage
         self._attr_name: Optional[str] = None
+        self._private_name: Optional[str] = None
+        self._use_instance_dict = False
+        self._has_state_callbacks = False
         self._transitions: list[StateTransition] = []
-        self._enter_state_callbacks: dict[Enum, set[Callable[[object, Enum, Enum], Any]]] = (
-            defaultdict(set)
-        )
-        self._exit_state_callbacks: dict[Enum, set[Callable[[object, Enum, Enum], Any]]] = (
-            defaultdict(set)
-        )
+        self._dispatchers: list[StateDispatcher] = []
+        # every owner class with its attributes holding transitions of this descriptor
+        self._owners: list[tuple[type, list[tuple[str, StateTransition]]]] = []
+        self._enter_state_callbacks: dict[
+            Enum, tuple[Callable[[object, Enum, Enum], Any], ...]
+        ] = {}
+        self._exit_state_callbacks: dict[Enum, tuple[Callable[[object, Enum, Enum], Any], ...]] = {}
+        # bits set at state values having callbacks, None when values cannot be used as bits
+        self._enter_mask: Optional[int] = 0 if _has_dense_int_values(states) else None
+        self._exit_mask: Optional[int] = self._enter_mask
 
     def __set_name__(self, owner: type, attr_name: str) -> None:
         """
         Called once at the creation of owner class
         """
         self._attr_name = attr_name
+        self._private_name = sys.intern('_' + attr_name)
+
+        owner_transitions: list[tuple[str, StateTransition]] = []
+        for name, value in owner.__dict__.items():
+            transition = _installed_transition(value)
+            if any(transition is own for own in self._transitions):
+                owner_transitions.append((name, transition))  # type: ignore[arg-type]
+        # descriptor may be shared by several classes, all of them are kept in sync
+        self._owners = [entry for entry in self._owners if entry[0] is not owner]
+        self._owners.append((owner, owner_transitions))
+
+        # state lives in the instance __dict__ only if no class attribute (slot, default) shadows it
+        self._use_instance_dict = all(
+            cls.__dictoffset__ != 0
+            and not any(self._private_name in vars(base) for base in cls.__mro__)
+            for cls, _ in self._owners
+        )
+
+        self._bind_transitions()
+        dispatch_storage = self._dispatch_storage()
+        for dispatcher in self._dispatchers:
+            dispatcher._state_storage = dispatch_storage
+
+    def _dispatch_storage(self) -> StateStorage:
+        """
+        Pick the cheapest storage able to read state for dispatched methods
+        """
+        if (
+            self._state_storage is None
+            and self._private_name is not None
+            and self._use_instance_dict
+        ):
+            return InstanceDictStateStorage(self._private_name, self._initial_state)
+
+        return ProxyStateStorage(self._get_state, self._force_set_state)
+
+    def _transition_storage(self) -> StateStorage:
+        """
+        Pick the cheapest storage able to serve transitions.
+        Enter/exit callbacks are fired only via _force_set_state
+        """
+        if self._has_state_callbacks:
+            return ProxyStateStorage(self._get_state, self._force_set_state)
+
+        return self._dispatch_storage()
+
+    def _bind_transitions(self) -> None:
+        storage = self._transition_storage()
+        for transition in self._transitions:
+            transition._storage = storage
+            transition._compiled = (
+                self._compile_transition(transition, storage._key)
+                if isinstance(storage, InstanceDictStateStorage) and transition._source_is_single
+                else None
+            )
+
+        # replace transition descriptors on owner classes with generated functions,
+        # so calls do not go through StateTransition.__get__
+        for owner, owner_transitions in self._owners:
+            for name, transition in owner_transitions:
+                compiled = transition._compiled
+                if compiled is None:
+                    setattr(owner, name, transition)
+                    continue
+
+                # separate function per attribute, so aliases keep their own names
+                function = FunctionType(
+                    compiled.__code__, compiled.__globals__, name, None, compiled.__closure__
+                )
+                function.__qualname__ = f'{owner.__qualname__}.{name}'
+                function.__module__ = owner.__module__
+                _INSTALLED_TRANSITIONS[function] = transition
+                setattr(owner, name, function)
+
+    def _compile_transition(
+        self, transition: StateTransition, key: str
+    ) -> Callable[[object], None]:
+        """
+        Generate a function performing single-source transition on the instance __dict__
+        with state key, states and callbacks bound at class creation
+        """
+        return _transition_factory(key, transition._has_callbacks)(
+            transition._source_single,
+            transition._dest,
+            self._initial_state,
+            transition._callbacks,
+            ImpossibleTransitionError,
+        )
 
     def __get__(self, instance: object, objtype: Optional[type]) -> Enum:
         """
@@ -177,31 +430,59 @@ class StateDescriptor:
             return self._state_storage.get_state(instance)
 
         else:
-            if self._attr_name is None:
+            if self._private_name is None:
                 raise ValueError('Cannot get state from unitialized descriptor')
 
+            if self._use_instance_dict:
+                return instance.__dict__.get(  # type: ignore[return-value]
+                    self._private_name, self._initial_state
+                )
+
             return getattr(  # type: ignore[return-value]
                 instance,
-                '_' + self._attr_name,
+                self._private_name,
                 self._initial_state,
             )
 
-    def _force_set_state(self, instance: object, state: Enum) -> None:
-        current_state = self._get_state(instance)
+    def _set_state(self, instance: object, state: Enum) -> None:
         if self._state_storage:
             self._state_storage.set_state(instance, state)
         else:
-            if self._attr_name is None:
+            if self._private_name is None:
                 raise ValueError('Cannot set state via unitialized descriptor')
-            setattr(
-                instance,
-                '_' + self._attr_name,
-                state,
-            )
-        for callback in self._exit_state_callbacks[current_state]:
-            callback(instance, current_state, state)
-        for callback in self._enter_state_callbacks[state]:
-            callback(instance, current_state, state)
+            if self._use_instance_dict:
+                instance.__dict__[self._private_name] = state
+            else:
+                setattr(
+                    instance,
+                    self._private_name,
+                    state,
+                )
+
+    def _force_set_state(self, instance: object, state: Enum) -> None:
+        # current state is only needed by enter/exit callbacks
+        if not self._has_state_callbacks:
+            self._set_state(instance, state)
+            return
+
+        current_state = self._get_state(instance)
+        self._set_state(instance, state)
+
+        # masks only apply to members, states from custom storage may be raw values
+        all_states = self._all_states
+        exit_mask = self._exit_mask
+        if (
+            exit_mask is None
+            or type(current_state) is not all_states
+            or exit_mask >> current_state._value_ & 1
+        ):
+            for callback in self._exit_state_callbacks.get(current_state, ()):
+                callback(instance, current_state, state)
+
+        enter_mask = self._enter_mask
+        if enter_mask is None or type(state) is not all_states or enter_mask >> state._value_ & 1:
+            for callback in self._enter_state_callbacks.get(state, ()):
+                callback(instance, current_state, state)
 
     def __set__(self, instance: object, value: Any) -> NoReturn:
         """
@@ -217,23 +498,20 @@ class StateDescriptor:
         if dest not in self._all_states:
             raise ValueError('Destination state not found', dest)
 
-        if not isinstance(source, Collection):
-            source = [source]
+        # materialize iterables, so one-shot ones survive validation
+        source = (source,) if isinstance(source, Enum) else tuple(source)
         for source_state in source:
             if source_state not in self._all_states:
                 raise ValueError('Source state not found', source)
 
-        transition = StateTransition(
-            source, dest, ProxyStateStorage(self._get_state, self._force_set_state)
-        )
+        transition = StateTransition(frozenset(source), dest, self._transition_storage())
         self._transitions.append(transition)
 
         return transition
 
     def dispatch(self, method: Callable[P, T]) -> StateDispatchedMethod[P, T]:
-        dispatcher = StateDispatcher(
-            ProxyStateStorage(self._get_state, self._force_set_state), self._all_states, method
-        )
+        dispatcher = StateDispatcher(self._dispatch_storage(), self._all_states, method)
+        self._dispatchers.append(dispatcher)
         dispatched_method = StateDispatchedMethod(dispatcher)
         return dispatched_method
 
@@ -245,8 +523,12 @@ class StateDescriptor:
         ) -> Callable[[object, Enum, Enum], Any]:
             for transition in transitions:
                 transition._register_callback(func)
+            self._bind_transitions()
             return func
 
+        # transitions of created classes are looked up by the functions installed in their place
+        transitions = tuple(_installed_transition(value) for value in transitions)  # type: ignore[misc]
+
         if (
             len(transitions) == 1
             and callable(transitions[0])
@@ -272,7 +554,14 @@ class StateDescriptor:
             func: Callable[[object, Enum, Enum], Any],
         ) -> Callable[[object, Enum, Enum], Any]:
             for state in states:
-                self._exit_state_callbacks[state].add(func)
+                callbacks = self._exit_state_callbacks.get(state, ())
+                if func not in callbacks:
+                    self._exit_state_callbacks[state] = (*callbacks, func)
+                if self._exit_mask is not None:
+                    self._exit_mask |= 1 << state._value_
+            if not self._has_state_callbacks:
+                self._has_state_callbacks = True
+                self._bind_transitions()
             return func
 
         if len(states) == 1 and callable(states[0]) and not isinstance(states[0], Enum):
@@ -293,7 +582,14 @@ class StateDescriptor:
             func: Callable[[object, Enum, Enum], Any],
         ) -> Callable[[object, Enum, Enum], Any]:
             for state in states:
-                self._enter_state_callbacks[state].add(func)
+                callbacks = self._enter_state_callbacks.get(state, ())
+                if func not in callbacks:
+                    self._enter_state_callbacks[state] = (*callbacks, func)
+                if self._enter_mask is not None:
+                    self._enter_mask |= 1 << state._value_
+            if not self._has_state_callbacks:
+                self._has_state_callbacks = True
+                self._bind_transitions()
             return func
 
         if len(states) == 1 and callable(states[0]) and not isinstance(states[0], Enum):
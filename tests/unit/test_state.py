@@ -1,8 +1,9 @@
 import unittest
-from enum import Enum, auto
+from enum import Enum, IntEnum, auto
+from types import FunctionType
 
 from fsmate import ImpossibleTransitionError, StateDescriptor
-from fsmate._state import AttributeStateStorage, StateDispatcher
+from fsmate._state import AttributeStateStorage, StateDispatcher, StateTransition
 from unittest.mock import MagicMock, call
 
 
@@ -12,6 +13,12 @@ class State(Enum):
     C = auto()
 
 
+class IntState(IntEnum):
+    A = 1
+    B = 2
+    C = 3
+
+
 class WrongState(Enum):
     D = auto()
     E = auto()
@@ -119,6 +126,210 @@ class TestTransitions(unittest.TestCase):
         with self.assertRaises(ImpossibleTransitionError):
             self.obj.to_b_from_a_or_c()
 
+    def test_one_shot_iterable_sources(self):
+        class Stub:
+            state = StateDescriptor(State, State.A)
+
+            to_b = state.transition((source for source in [State.A, State.C]), State.B)
+            to_c = state.transition(iter([State.B]), State.C)
+
+        obj = Stub()
+        obj.to_b()
+        self.assertEqual(obj.state, State.B)
+        obj.to_c()
+        self.assertEqual(obj.state, State.C)
+        obj.to_b()
+        self.assertEqual(obj.state, State.B)
+
+    def test_custom_storage_transition(self):
+        callback_mock = MagicMock()
+
+        class Stub:
+            state_attribute: State = State.A
+            state = StateDescriptor(State, state_storage=AttributeStateStorage('state_attribute'))
+
+            to_b = state.transition(State.A, State.B)
+
+        obj = Stub()
+        obj.to_b()
+        self.assertEqual(obj.state_attribute, State.B)
+
+        Stub.state.on_state_exited(State.A)(callback_mock)  # type: ignore[attr-defined]
+        obj.state_attribute = State.A
+        obj.to_b()
+        self.assertEqual(obj.state_attribute, State.B)
+        callback_mock.assert_called_once_with(obj, State.A, State.B)
+
+        obj.state_attribute = State.B
+        with self.assertRaises(ImpossibleTransitionError):
+            obj.to_b()
+
+    def test_custom_storage_equal_state(self):
+        class Stub:
+            state_attribute = 1
+            state = StateDescriptor(
+                IntState, state_storage=AttributeStateStorage('state_attribute')
+            )
+
+            to_b = state.transition(IntState.A, IntState.B)
+            to_c = state.transition([IntState.B, IntState.C], IntState.C)
+
+        obj = Stub()
+        obj.to_b()
+        self.assertIs(obj.state_attribute, IntState.B)
+
+        obj.state_attribute = 2
+        obj.to_c()
+        self.assertIs(obj.state_attribute, IntState.C)
+
+    def test_slotted_owner(self):
+        class Stub:
+            __slots__ = ('_state',)
+
+            state = StateDescriptor(State, State.A)
+
+            to_b = state.transition(State.A, State.B)
+            to_c = state.transition(State.B, State.C)
+
+        obj = Stub()
+        obj.to_b()
+        self.assertEqual(obj.state, State.B)
+        obj.to_c()
+        self.assertEqual(obj.state, State.C)
+
+        with self.assertRaises(ImpossibleTransitionError):
+            obj.to_b()
+
+    def test_transitions_installed_on_owner(self):
+        class Stub:
+            state = StateDescriptor(State, State.A)
+
+            to_b = state.transition(State.A, State.B)
+            go_b = to_b
+            to_a = state.transition(State.B, State.A)
+
+        self.assertIsInstance(Stub.__dict__['to_b'], FunctionType)
+        self.assertIsInstance(Stub.__dict__['go_b'], FunctionType)
+        self.assertEqual(Stub.to_b.__qualname__, f'{Stub.__qualname__}.to_b')
+        self.assertEqual(Stub.go_b.__qualname__, f'{Stub.__qualname__}.go_b')
+        self.assertEqual(Stub.to_b.__module__, __name__)
+
+        obj = Stub()
+        obj.go_b()
+        self.assertEqual(obj.state, State.B)
+        obj.to_a()
+        obj.to_b()
+        self.assertEqual(obj.state, State.B)
+
+    def test_transitions_reinstalled_after_state_callback(self):
+        callback_mock = MagicMock()
+
+        class Stub:
+            state = StateDescriptor(State, State.A)
+
+            to_b = state.transition(State.A, State.B)
+            go_b = to_b
+
+        Stub.state.on_state_entered(State.B)(callback_mock)  # type: ignore[attr-defined]
+
+        self.assertIsInstance(Stub.__dict__['to_b'], StateTransition)
+        self.assertIs(Stub.__dict__['go_b'], Stub.__dict__['to_b'])
+
+        obj = Stub()
+        obj.go_b()
+        callback_mock.assert_called_once_with(obj, State.A, State.B)
+
+    def test_transition_callbacks_on_alias(self):
+        callback_mock = MagicMock()
+
+        class Stub:
+            state = StateDescriptor(State, State.A)
+
+            to_b = state.transition(State.A, State.B)
+            go_b = to_b
+
+        Stub.state.on_transition(Stub.go_b)(callback_mock)  # type: ignore[attr-defined]
+
+        obj = Stub()
+        obj.to_b()
+        callback_mock.assert_called_once_with(obj, State.A, State.B)
+        self.assertEqual(Stub.go_b.__qualname__, f'{Stub.__qualname__}.go_b')
+
+    def test_slotted_owner_with_dict(self):
+        class Stub:
+            __slots__ = ('_state', '__dict__')
+
+            state = StateDescriptor(State, State.A)
+
+            to_c = state.transition(State.B, State.C)
+
+        obj = Stub()
+        obj._state = State.B
+        self.assertEqual(obj.state, State.B)
+
+        obj.to_c()
+        self.assertEqual(obj._state, State.C)
+        self.assertEqual(obj.state, State.C)
+
+    def test_class_level_state_default(self):
+        class Base:
+            _state = State.B
+
+        class Stub(Base):
+            state = StateDescriptor(State, State.A)
+
+            to_c = state.transition(State.B, State.C)
+
+        obj = Stub()
+        self.assertEqual(obj.state, State.B)
+
+        obj.to_c()
+        self.assertEqual(obj.state, State.C)
+        self.assertEqual(Base._state, State.B)
+
+    def test_descriptor_shared_by_several_owners(self):
+        callback_mock = MagicMock()
+        machine = StateDescriptor(State, State.A)
+        machine_to_b = machine.transition(State.A, State.B)
+
+        class First:
+            state = machine
+            to_b = machine_to_b
+
+        class Second:
+            state = machine
+            to_b = machine_to_b
+
+        machine.on_state_entered(State.B)(callback_mock)
+
+        first, second = First(), Second()
+        first.to_b()
+        second.to_b()
+        self.assertEqual(first.state, State.B)
+        self.assertEqual(second.state, State.B)
+        callback_mock.assert_has_calls(
+            [call(first, State.A, State.B), call(second, State.A, State.B)]
+        )
+        self.assertEqual(callback_mock.call_count, 2)
+
+    def test_foreign_transition_after_class_creation(self):
+        class Stub:
+            state = StateDescriptor(State, State.A)
+
+            to_b = state.transition(State.A, State.B)
+
+        class Other:
+            state = StateDescriptor(State, State.A)
+
+            to_b = state.transition(State.A, State.B)
+
+        with self.assertRaisesRegex(ValueError, 'Transition not found in current state machine'):
+            Stub.state.on_transition(Other.to_b)  # type: ignore[attr-defined]
+
+        obj = Stub()
+        obj.to_b()
+        self.assertEqual(obj.state, State.B)
+
 
 class TestMethodOverload(unittest.TestCase):
     def test_state_dispatcher(self):
@@ -152,6 +363,52 @@ class TestMethodOverload(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, 'Function is already overloaded for state'):
             dispatcher.register(lambda x: x, State.B)
 
+    def test_state_dispatcher_unknown_state(self):
+        class ForeignState(Enum):
+            X = 2
+            Y = 50
+
+        class StubStateStorage:
+            state = None
+
+            def get_state(self, instance):
+                return self.state
+
+            def set_state(self, instance, state):
+                self.state = state
+
+        storage = StubStateStorage()
+        dispatcher = StateDispatcher(storage, State, lambda: 'fallback')
+        dispatcher.register(lambda: 'b', State.B)
+
+        self.assertEqual(dispatcher.dispatch(None), 'fallback')
+        storage.set_state(None, ForeignState.X)
+        self.assertEqual(dispatcher.dispatch(None), 'fallback')
+        storage.set_state(None, ForeignState.Y)
+        self.assertEqual(dispatcher.dispatch(None), 'fallback')
+
+    def test_state_dispatcher_non_int_values(self):
+        class StrState(Enum):
+            A = 'a'
+            B = 'b'
+
+        class StubStateStorage:
+            state = StrState.A
+
+            def get_state(self, instance):
+                return self.state
+
+            def set_state(self, instance, state):
+                self.state = state
+
+        storage = StubStateStorage()
+        dispatcher = StateDispatcher(storage, StrState, lambda: 'fallback')
+        dispatcher.register(lambda: 'b', StrState.B)
+
+        self.assertEqual(dispatcher.dispatch(None), 'fallback')
+        storage.set_state(None, StrState.B)
+        self.assertEqual(dispatcher.dispatch(None), 'b')
+
     def test_overload(self):
         class Stub:
             state = StateDescriptor(State, State.A)
@@ -177,6 +434,51 @@ class TestMethodOverload(unittest.TestCase):
         obj.to_c()
         self.assertEqual(obj.foo(), 0)
 
+    def test_overload_custom_storage_unknown_state(self):
+        class Stub:
+            state_attribute = None
+            state = StateDescriptor(State, state_storage=AttributeStateStorage('state_attribute'))
+
+            @state.dispatch
+            def foo(self):
+                return 0
+
+            @foo.overload(State.B)
+            def _(self):
+                return 1
+
+        obj = Stub()
+        self.assertEqual(obj.foo(), 0)
+
+        obj.state_attribute = WrongState.E
+        self.assertEqual(obj.foo(), 0)
+
+        obj.state_attribute = State.B
+        self.assertEqual(obj.foo(), 1)
+
+    def test_overload_slotted_owner(self):
+        class Stub:
+            __slots__ = ('_state',)
+
+            state = StateDescriptor(State, State.A)
+
+            to_b = state.transition(State.A, State.B)
+
+            @state.dispatch
+            def foo(self):
+                return 0
+
+            @foo.overload(State.B)
+            def _(self):
+                return 1
+
+        obj = Stub()
+
+        self.assertEqual(obj.foo(), 0)
+
+        obj.to_b()
+        self.assertEqual(obj.foo(), 1)
+
 
 class TestCallbacks(unittest.TestCase):
     def test_transition_callbacks(self) -> None:
@@ -426,3 +728,99 @@ class TestCallbacks(unittest.TestCase):
             ],
             any_order=True,
         )
+
+    def test_state_callbacks_registered_after_class_creation(self):
+        callback_mock = MagicMock()
+
+        class Stub:
+            state = StateDescriptor(State, State.A)
+
+            to_b = state.transition(State.A, State.B)
+
+        obj = Stub()
+        Stub.state.on_state_entered(State.B)(callback_mock)  # type: ignore[attr-defined]
+
+        obj.to_b()
+        callback_mock.assert_called_once_with(obj, State.A, State.B)
+
+    def test_transition_callbacks_registered_after_class_creation(self):
+        callback_mock = MagicMock()
+
+        class Stub:
+            state = StateDescriptor(State, State.A)
+
+            to_b = state.transition(State.A, State.B)
+
+        obj = Stub()
+        Stub.state.on_transition(Stub.to_b)(callback_mock)  # type: ignore[attr-defined]
+
+        obj.to_b()
+        callback_mock.assert_called_once_with(obj, State.A, State.B)
+
+    def test_state_callbacks_non_int_values(self):
+        callback_mock = MagicMock()
+
+        class StrState(Enum):
+            A = 'a'
+            B = 'b'
+
+        class Stub:
+            state = StateDescriptor(StrState, StrState.A)
+
+            to_b = state.transition(StrState.A, StrState.B)
+            to_a = state.transition(StrState.B, StrState.A)
+
+            @state.on_state_exited(StrState.A)  # type: ignore
+            def on_a_exited(self, from_state, to_state):
+                callback_mock('A_exited', self, from_state, to_state)
+
+            @state.on_state_entered(StrState.A)  # type: ignore
+            def on_a_entered(self, from_state, to_state):
+                callback_mock('A_entered', self, from_state, to_state)
+
+        obj = Stub()
+
+        obj.to_b()
+        callback_mock.assert_called_once_with('A_exited', obj, StrState.A, StrState.B)
+        callback_mock.reset_mock()
+
+        obj.to_a()
+        callback_mock.assert_called_once_with('A_entered', obj, StrState.B, StrState.A)
+
+    def test_state_callbacks_registration_order(self):
+        callback_mock = MagicMock()
+
+        class Stub:
+            state = StateDescriptor(State, State.A)
+
+            to_b = state.transition(State.A, State.B)
+
+            @state.on_state_entered(State.B)  # type: ignore
+            def on_b_entered_first(self, from_state: State, to_state: State):
+                callback_mock('first')
+
+            @state.on_state_entered(State.B)  # type: ignore
+            def on_b_entered_second(self, from_state: State, to_state: State):
+                callback_mock('second')
+
+        Stub().to_b()
+        self.assertEqual(callback_mock.mock_calls, [call('first'), call('second')])
+
+    def test_state_callbacks_custom_storage_raw_value(self):
+        callback_mock = MagicMock()
+
+        class Stub:
+            state_attribute = 1
+            state = StateDescriptor(
+                IntState, state_storage=AttributeStateStorage('state_attribute')
+            )
+
+            to_b = state.transition([IntState.A, IntState.C], IntState.B)
+
+            @state.on_state_exited(IntState.A)  # type: ignore
+            def on_a_exited(self, from_state, to_state):
+                callback_mock('A_exited', self, from_state, to_state)
+
+        obj = Stub()
+        obj.to_b()
+        callback_mock.assert_called_once_with('A_exited', obj, 1, IntState.B)